@@ -6,13 +6,22 @@ translation, translation memory, and style guide access from any
 MCP-compatible AI tool (Claude Code, Cursor, Windsurf, etc.).
 """
 
+import asyncio
+import hashlib
 import os
+import random
 import sys
-import json
 import logging
-from typing import Any, Optional
-
-import httpx
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, fields as dataclass_fields
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Callable, Collection, Mapping, NamedTuple, Optional, Protocol
+
+import orjson
 from mcp.server.fastmcp import FastMCP
 
 logging.basicConfig(level=logging.INFO, stream=sys.stderr)
@@ -23,18 +32,318 @@ logger = logging.getLogger("nativ-mcp")
 # ---------------------------------------------------------------------------
 
 DEFAULT_API_URL = "https://api.usenativ.com"
+DEFAULT_BATCH_CONCURRENCY = 8
+DEFAULT_CACHE_TTL = 60.0
+CACHE_MAX_ENTRIES = 256
+# Rarely-changing settings served stale for up to one extra TTL while a
+# background refresh runs, so prompt/resource reads never block at expiry.
+SWR_PATHS = frozenset({
+    "/user/languages",
+    "/style-guide",
+    "/style-guide/prompt",
+    "/style-guide/combined",
+})
+DEFAULT_TRANSLATION_CACHE_TTL = 24 * 60 * 60.0
+DEFAULT_HTTP_BACKEND = "httpx"
+REQUEST_TIMEOUT = 120.0
+DEFAULT_MAX_RETRIES = 3
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# POSTs (e.g. paid translations) may already have run upstream behind a
+# 502/504, so only statuses that mean "not processed" are retried for them.
+UNSAFE_RETRY_STATUSES = frozenset({429, 503})
+MAX_RETRY_DELAY = 60.0
+# How long a TM search with no matches short-circuits equivalent searches.
+TM_MISS_TTL = 60.0
+TM_MISS_MAX_ENTRIES = 4096
+
+
+class TranslationCache:
+    """Persistent exact-match cache of translate responses, backed by SQLite.
+
+    Entries are keyed by a SHA-256 of the workspace and the full request body,
+    so any change to text, languages, context, glossary or formality misses.
+    Each entry also records its workspace namespace so a TM write can drop
+    every translation produced from the old TM.
+
+    Queries run in a worker thread so commits never block the event loop. A
+    database error (locked by another server process, read-only, disk full)
+    is logged and treated as a miss, so it never fails a translation.
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, path: str, ttl: float = DEFAULT_TRANSLATION_CACHE_TTL):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.ttl = ttl
+        self._db = sqlite3.connect(path, timeout=1.0, check_same_thread=False)
+        self._lock = threading.Lock()
+        (version,) = self._db.execute("PRAGMA user_version").fetchone()
+        if version != self.SCHEMA_VERSION:
+            self._db.execute("DROP TABLE IF EXISTS translations")
+            self._db.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "key TEXT PRIMARY KEY, namespace TEXT NOT NULL, "
+            "expires_at REAL NOT NULL, response TEXT NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS translations_namespace ON translations (namespace)"
+        )
+        self._db.execute("DELETE FROM translations WHERE expires_at <= ?", (time.time(),))
+        self._db.commit()
+
+    @staticmethod
+    def make_key(namespace: str, body: dict[str, Any]) -> str:
+        payload = orjson.dumps([namespace, body], option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(payload).hexdigest()
+
+    async def _run(self, op: Callable[[], Any], default: Any) -> Any:
+        def locked() -> Any:
+            with self._lock:
+                try:
+                    return op()
+                except sqlite3.Error as e:
+                    logger.warning("Translation cache unavailable: %s", e)
+                    try:
+                        self._db.rollback()
+                    except sqlite3.Error:
+                        pass
+                    return default
+
+        return await asyncio.to_thread(locked)
+
+    async def get_many(self, keys: list[str]) -> list[dict[str, Any] | None]:
+        def op() -> list[dict[str, Any] | None]:
+            now = time.time()
+            results = []
+            for key in keys:
+                row = self._db.execute(
+                    "SELECT response FROM translations WHERE key = ? AND expires_at > ?",
+                    (key, now),
+                ).fetchone()
+                results.append(orjson.loads(row[0]) if row else None)
+            return results
+
+        return await self._run(op, [None] * len(keys))
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        return (await self.get_many([key]))[0]
+
+    async def put_many(self, namespace: str, items: list[tuple[str, dict[str, Any]]]) -> None:
+        """Store several responses in one transaction."""
+        if not items:
+            return
+
+        def op() -> None:
+            expires_at = time.time() + self.ttl
+            self._db.executemany(
+                "INSERT OR REPLACE INTO translations (key, namespace, expires_at, response) "
+                "VALUES (?, ?, ?, ?)",
+                [(key, namespace, expires_at, orjson.dumps(data).decode()) for key, data in items],
+            )
+            self._db.commit()
+
+        await self._run(op, None)
+
+    async def put(self, namespace: str, key: str, data: dict[str, Any]) -> None:
+        await self.put_many(namespace, [(key, data)])
+
+    async def clear(self, namespace: str) -> None:
+        """Drop every cached translation for one workspace."""
+
+        def op() -> None:
+            self._db.execute("DELETE FROM translations WHERE namespace = ?", (namespace,))
+            self._db.commit()
+
+        await self._run(op, None)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+@dataclass(slots=True)
+class TMMatch:
+    """Translation memory match reported alongside a translation."""
+
+    score: float = 0.0
+    match_type: str = "unknown"
+    tm_source: str = "N/A"
+    source_text: str = ""
+    target_text: str = ""
+
+    @classmethod
+    def from_result(cls, result: dict[str, Any]) -> "TMMatch | None":
+        """Parse a translate response's `tm_match`, or None if it has none."""
+        tm = result.get("tm_match")
+        if not tm:
+            return None
+        return cls(**{name: tm[name] for name in _TM_MATCH_FIELDS if name in tm})
+
+
+_TM_MATCH_FIELDS = tuple(f.name for f in dataclass_fields(TMMatch))
+
+
+class NativAPIError(RuntimeError):
+    """The Nativ API answered with an error status."""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class _Response(NamedTuple):
+    status_code: int
+    headers: Mapping[str, str]
+    content: bytes
+    http_version: str
+
+
+class _Transport(Protocol):
+    """HTTP backend used by NativClient; one pooled session per client."""
+
+    async def request(
+        self, method: str, path: str, *, content: bytes | None, params: dict | None
+    ) -> _Response: ...
+
+    async def aclose(self) -> None: ...
+
+
+class _HttpxTransport:
+    def __init__(self, base_url: str, headers: dict[str, str]):
+        # Imported here rather than at module level so spawning the server
+        # doesn't pay for it before the first tool call needs a client.
+        import httpx
+
+        # HTTP/2 multiplexes concurrent batch requests over one connection.
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=REQUEST_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            http2=True,
+        )
+
+    async def request(
+        self, method: str, path: str, *, content: bytes | None, params: dict | None
+    ) -> _Response:
+        resp = await self._client.request(method, path, content=content, params=params)
+        return _Response(resp.status_code, resp.headers, resp.content, resp.http_version)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+class _AiohttpTransport:
+    def __init__(self, base_url: str, headers: dict[str, str]):
+        try:
+            import aiohttp
+        except ImportError:
+            raise RuntimeError(
+                "NATIV_HTTP_BACKEND=aiohttp requires aiohttp: pip install 'nativ-mcp[aiohttp]'"
+            ) from None
+
+        self._aiohttp = aiohttp
+        self._base_url = base_url
+        self._headers = headers
+        self._session: aiohttp.ClientSession | None = None
+
+    def _get_session(self) -> Any:
+        # ClientSession binds to the running loop, so build it on first use.
+        if self._session is None:
+            aiohttp = self._aiohttp
+            self._session = aiohttp.ClientSession(
+                headers=self._headers,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=600, keepalive_timeout=60),
+            )
+        return self._session
+
+    async def request(
+        self, method: str, path: str, *, content: bytes | None, params: dict | None
+    ) -> _Response:
+        session = self._get_session()
+        async with session.request(method, self._base_url + path, data=content, params=params) as resp:
+            body = await resp.read()
+            version = f"HTTP/{resp.version.major}.{resp.version.minor}" if resp.version else ""
+            return _Response(resp.status, resp.headers, body, version)
+
+    async def aclose(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+
+
+_HTTP_BACKENDS: dict[str, type] = {
+    "httpx": _HttpxTransport,
+    "aiohttp": _AiohttpTransport,
+}
 
 
 class NativClient:
     """Thin async wrapper around the Nativ REST API."""
 
-    def __init__(self, api_key: str, base_url: str | None = None):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str | None = None,
+        *,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        translation_cache: TranslationCache | None = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        http_backend: str = DEFAULT_HTTP_BACKEND,
+    ):
         self.base_url = (base_url or DEFAULT_API_URL).rstrip("/")
         self.headers = {
             "X-API-Key": api_key,
             "Content-Type": "application/json",
             "User-Agent": "nativ-mcp/0.1.0",
+            "Accept-Encoding": "gzip, br",
         }
+        transport_cls = _HTTP_BACKENDS.get(http_backend)
+        if transport_cls is None:
+            raise ValueError(
+                f"Unknown HTTP backend {http_backend!r}; expected one of: {', '.join(_HTTP_BACKENDS)}"
+            )
+        # One pooled transport for the lifetime of the server so keep-alive
+        # connections are reused instead of paying a TLS handshake per call.
+        self._transport: _Transport = transport_cls(self.base_url, self.headers)
+        self._max_retries = max_retries
+        # GET responses are cached for `cache_ttl` seconds (0 disables).
+        # Keyed by (path, sorted params); values are (fetched_at, data).
+        self._cache_ttl = cache_ttl
+        self._cache: OrderedDict[tuple, tuple[float, dict[str, Any]]] = OrderedDict()
+        # Identical GETs already on the wire; later callers await the same task.
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        # Recent TM searches that found nothing:
+        # (normalized query, source, target) -> (recorded_at, score_cutoff).
+        self._tm_misses: dict[tuple[str, str, str], tuple[float, float]] = {}
+        # Whether the API exposes /text/culturalize/batch; None until probed.
+        self._batch_supported: bool | None = None
+        self._translation_cache = translation_cache
+        # Bumped on every TM write; a translation whose request started under
+        # an older generation may not reflect the new entry and isn't cached.
+        self._tm_generation = 0
+        # Translations depend on the workspace's TM and style guides, so cached
+        # responses are scoped to the API URL + key that produced them.
+        self._cache_namespace = hashlib.sha256(f"{self.base_url}\n{api_key}".encode()).hexdigest()
+
+    @property
+    def cache_enabled(self) -> bool:
+        """Whether GET responses are cached (NATIV_CACHE_TTL > 0)."""
+        return self._cache_ttl > 0
+
+    async def close(self) -> None:
+        for task in self._inflight.values():
+            task.cancel()
+        await self._transport.aclose()
+        if self._translation_cache is not None:
+            self._translation_cache.close()
+
+    async def __aenter__(self) -> "NativClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
 
     async def _request(
         self,
@@ -43,24 +352,116 @@ class NativClient:
         *,
         json_body: dict | None = None,
         params: dict | None = None,
+        refresh: bool = False,
+    ) -> dict[str, Any]:
+        if method != "GET":
+            return await self._send(method, path, json_body=json_body, params=params)
+
+        key = (path, tuple(sorted(params.items())) if params else ())
+        if self._cache_ttl > 0 and not refresh:
+            cached = self._cache_lookup(key)
+            if cached is not None:
+                return cached
+        # shield() so one caller being cancelled doesn't fail the others.
+        return await asyncio.shield(self._fetch(key))
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        json_body: dict | None = None,
+        params: dict | None = None,
     ) -> dict[str, Any]:
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            resp = await client.request(
-                method,
-                f"{self.base_url}{path}",
-                headers=self.headers,
-                json=json_body,
-                params=params,
+        # Encoded once (and reused across retries); the client already sends
+        # Content-Type: application/json.
+        content = orjson.dumps(json_body) if json_body is not None else None
+        # Rate limits and gateway errors are retried with exponential backoff
+        # plus jitter, honouring Retry-After when the API sends one.
+        retry_statuses = RETRY_STATUSES if method == "GET" else UNSAFE_RETRY_STATUSES
+        for attempt in range(self._max_retries + 1):
+            resp = await self._transport.request(method, path, content=content, params=params)
+            logger.debug("%s %s -> %s (%s)", method, path, resp.status_code, resp.http_version)
+            if resp.status_code not in retry_statuses or attempt == self._max_retries:
+                break
+            delay = _retry_delay(resp.headers.get("Retry-After"), attempt)
+            logger.warning(
+                "%s %s returned %s; retrying in %.1fs (%d/%d)",
+                method, path, resp.status_code, delay, attempt + 1, self._max_retries,
+            )
+            await asyncio.sleep(delay)
+
+        if resp.status_code == 402:
+            raise RuntimeError("Insufficient Nativ credits. Top up at https://dashboard.usenativ.com")
+        if resp.status_code >= 400:
+            detail = resp.content[:200].decode("utf-8", errors="replace")
+            raise NativAPIError(
+                resp.status_code, f"Nativ API returned {resp.status_code} for {method} {path}: {detail}"
             )
-            if resp.status_code == 402:
-                raise RuntimeError("Insufficient Nativ credits. Top up at https://dashboard.usenativ.com")
-            resp.raise_for_status()
-            return resp.json()
+        return orjson.loads(resp.content)
+
+    def _cache_lookup(self, key: tuple) -> dict[str, Any] | None:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        fetched_at, data = entry
+        age = time.monotonic() - fetched_at
+        if age >= self._cache_ttl:
+            if key[0] not in SWR_PATHS or age >= 2 * self._cache_ttl:
+                del self._cache[key]
+                return None
+            self._revalidate(key)
+        self._cache.move_to_end(key)
+        return data
+
+    def _cache_store(self, key: tuple, data: dict[str, Any]) -> None:
+        self._cache[key] = (time.monotonic(), data)
+        self._cache.move_to_end(key)
+        if len(self._cache) > CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+
+    def _fetch(self, key: tuple) -> asyncio.Task:
+        """GET `key`, joining an identical request already in flight if any."""
+        task = self._inflight.get(key)
+        if task is not None:
+            return task
+
+        async def fetch() -> dict[str, Any]:
+            data = await self._send("GET", key[0], params=dict(key[1]) or None)
+            # Skip storing if invalidate_cache() dropped this request meanwhile.
+            if self._cache_ttl > 0 and self._inflight.get(key) is asyncio.current_task():
+                self._cache_store(key, data)
+            return data
+
+        def done(finished: asyncio.Task) -> None:
+            if self._inflight.get(key) is finished:
+                del self._inflight[key]
+
+        task = asyncio.ensure_future(fetch())
+        task.add_done_callback(done)
+        self._inflight[key] = task
+        return task
+
+    def _revalidate(self, key: tuple) -> None:
+        """Refresh a stale cache entry in the background."""
+
+        def log_failure(task: asyncio.Task) -> None:
+            if not task.cancelled() and task.exception() is not None:
+                logger.warning("Background refresh of %s failed: %s", key[0], task.exception())
+
+        self._fetch(key).add_done_callback(log_failure)
+
+    def invalidate_cache(self, prefix: str = "") -> None:
+        """Drop cached GET responses whose path starts with `prefix`."""
+        for key in [k for k in self._cache if k[0].startswith(prefix)]:
+            del self._cache[key]
+        for key in [k for k in self._inflight if k[0].startswith(prefix)]:
+            del self._inflight[key]
 
     # -- Translation --------------------------------------------------------
 
-    async def translate(
-        self,
+    @staticmethod
+    def _translate_body(
         text: str,
         language: str,
         *,
@@ -74,7 +475,13 @@ class NativClient:
         include_tm_info: bool = True,
         backtranslate: bool = False,
         include_rationale: bool = True,
+        fields: Collection[str] | None = None,
     ) -> dict[str, Any]:
+        if fields is not None:
+            # Ask only for the response fields the caller will read.
+            include_tm_info = any(f == "tm_match" or f.startswith("tm_match.") for f in fields)
+            backtranslate = "backtranslation" in fields
+            include_rationale = "rationale" in fields
         body: dict[str, Any] = {
             "text": text,
             "language": language,
@@ -95,7 +502,154 @@ class NativClient:
             body["formality"] = formality
         if max_characters is not None:
             body["max_characters"] = max_characters
-        return await self._request("POST", "/text/culturalize", json_body=body)
+        return body
+
+    def _cache_for(self, body: dict[str, Any], no_cache: bool) -> TranslationCache | None:
+        """The translation cache, if this request is eligible for it."""
+        if no_cache or body["backtranslate"] or body["include_rationale"]:
+            return None
+        return self._translation_cache
+
+    async def translate(
+        self,
+        text: str,
+        language: str,
+        *,
+        language_code: str | None = None,
+        source_language: str = "English",
+        source_language_code: str = "en",
+        context: str | None = None,
+        glossary: str | None = None,
+        formality: str | None = None,
+        max_characters: int | None = None,
+        include_tm_info: bool = True,
+        backtranslate: bool = False,
+        include_rationale: bool = True,
+        fields: Collection[str] | None = None,
+        no_cache: bool = False,
+    ) -> dict[str, Any]:
+        """Translate `text`, reusing a cached response when one is available.
+
+        `fields` names the response fields the caller needs ("tm_match" or
+        "tm_match.<key>", "backtranslation", "rationale"; "translated_text"
+        is always returned) and, when given, overrides `include_tm_info`,
+        `backtranslate` and `include_rationale`.
+
+        Requests asking for a back-translation or rationale are never cached,
+        since those outputs are meant to be generated fresh; `no_cache=True`
+        bypasses the cache for any request.
+        """
+        body = self._translate_body(
+            text,
+            language,
+            language_code=language_code,
+            source_language=source_language,
+            source_language_code=source_language_code,
+            context=context,
+            glossary=glossary,
+            formality=formality,
+            max_characters=max_characters,
+            include_tm_info=include_tm_info,
+            backtranslate=backtranslate,
+            include_rationale=include_rationale,
+            fields=fields,
+        )
+        cache = self._cache_for(body, no_cache)
+        if cache is None:
+            return await self._request("POST", "/text/culturalize", json_body=body)
+
+        key = cache.make_key(self._cache_namespace, body)
+        cached = await cache.get(key)
+        if cached is not None:
+            return cached
+        generation = self._tm_generation
+        result = await self._request("POST", "/text/culturalize", json_body=body)
+        if generation == self._tm_generation:
+            await cache.put(self._cache_namespace, key, result)
+        return result
+
+    async def translate_many(
+        self,
+        texts: list[str],
+        language: str,
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        no_cache: bool = False,
+        **options: Any,
+    ) -> list[dict[str, Any] | Exception]:
+        """Translate several texts into one language, preserving input order.
+
+        Sends one request to the batch endpoint when the API supports it and
+        otherwise falls back to concurrent `translate` calls. `options` are
+        the keyword arguments accepted by `translate`. A failed item is
+        returned as its exception instead of being raised.
+        """
+        if self._batch_supported is not False:
+            try:
+                return await self._translate_batch_endpoint(texts, language, no_cache, options)
+            except NativAPIError as e:
+                # Until a batch call has succeeded once, a 400/422 most likely
+                # means this server's batch endpoint expects another payload.
+                unsupported = {404, 405} if self._batch_supported else {400, 404, 405, 422}
+                if e.status_code not in unsupported:
+                    return [e] * len(texts)
+                logger.info("Batch translation endpoint unavailable; using per-item requests")
+                self._batch_supported = False
+            except Exception as e:
+                return [e] * len(texts)
+
+        sem = asyncio.Semaphore(max(1, concurrency))
+
+        async def one(text: str) -> dict[str, Any] | Exception:
+            async with sem:
+                try:
+                    return await self.translate(text, language, no_cache=no_cache, **options)
+                except Exception as e:
+                    return e
+
+        return list(await asyncio.gather(*(one(text) for text in texts)))
+
+    async def _translate_batch_endpoint(
+        self,
+        texts: list[str],
+        language: str,
+        no_cache: bool,
+        options: dict[str, Any],
+    ) -> list[dict[str, Any] | Exception]:
+        bodies = [self._translate_body(text, language, **options) for text in texts]
+        results: list[dict[str, Any] | Exception | None] = [None] * len(texts)
+        cache = self._cache_for(bodies[0], no_cache) if bodies else None
+        keys: list[str] = []
+        if cache is not None:
+            keys = [cache.make_key(self._cache_namespace, body) for body in bodies]
+            results[:] = await cache.get_many(keys)
+
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results  # type: ignore[return-value]
+
+        batch_body = {k: v for k, v in bodies[0].items() if k != "text"}
+        batch_body["items"] = [{"text": texts[i]} for i in pending]
+        generation = self._tm_generation
+        response = await self._request("POST", "/text/culturalize/batch", json_body=batch_body)
+        self._batch_supported = True
+
+        items = response.get("results", [])
+        if len(items) != len(pending):
+            raise RuntimeError(
+                f"Batch translation returned {len(items)} results for {len(pending)} texts"
+            )
+        to_cache = []
+        for i, item in zip(pending, items):
+            if item.get("error"):
+                results[i] = RuntimeError(item["error"])
+                continue
+            results[i] = item
+            if cache is not None:
+                to_cache.append((keys[i], item))
+        if cache is not None and generation == self._tm_generation:
+            await cache.put_many(self._cache_namespace, to_cache)
+        return results  # type: ignore[return-value]
 
     # -- Languages ----------------------------------------------------------
 
@@ -112,7 +666,24 @@ class NativClient:
         target_lang: str | None = None,
         score_cutoff: float = 0.0,
         limit: int = 20,
+        force: bool = False,
     ) -> dict[str, Any]:
+        """Fuzzy-search the TM.
+
+        A search with a positive limit that found nothing answers equivalent
+        searches (same whitespace-normalized query and languages, any limit,
+        equal or higher cutoff) locally for TM_MISS_TTL seconds, unless
+        caching is disabled (`cache_ttl=0`). `force=True` always queries the
+        API.
+        """
+        use_misses = self._cache_ttl > 0
+        miss_key = (" ".join(query.split()), source_lang, target_lang or "")
+        now = time.monotonic()
+        if use_misses and not force:
+            miss = self._tm_misses.get(miss_key)
+            if miss is not None and now - miss[0] < TM_MISS_TTL and score_cutoff >= miss[1]:
+                return {"matches": []}
+
         params: dict[str, Any] = {
             "query": query,
             "source_lang": source_lang,
@@ -121,7 +692,26 @@ class NativClient:
         }
         if target_lang:
             params["target_lang"] = target_lang
-        return await self._request("GET", "/master-tm/fuzzy-search", params=params)
+        result = await self._request("GET", "/master-tm/fuzzy-search", params=params, refresh=force)
+
+        # With limit <= 0 the API returns nothing regardless, so an empty
+        # result says nothing about the query.
+        if not use_misses or limit <= 0:
+            return result
+        if result.get("matches"):
+            self._tm_misses.pop(miss_key, None)
+        else:
+            if len(self._tm_misses) >= TM_MISS_MAX_ENTRIES:
+                self._tm_misses = {
+                    k: v for k, v in self._tm_misses.items() if now - v[0] < TM_MISS_TTL
+                }
+                if len(self._tm_misses) >= TM_MISS_MAX_ENTRIES:
+                    self._tm_misses.clear()
+            miss = self._tm_misses.get(miss_key)
+            if miss is not None and now - miss[0] < TM_MISS_TTL:
+                score_cutoff = min(score_cutoff, miss[1])
+            self._tm_misses[miss_key] = (now, score_cutoff)
+        return result
 
     async def list_tm_entries(
         self,
@@ -159,18 +749,35 @@ class NativClient:
         }
         if source_name:
             body["source_name"] = source_name
-        return await self._request("POST", "/master-tm/entries", json_body=body)
+        # Bumped before and after the write: translations started while it is
+        # pending may or may not see the entry, so none of them are cached.
+        self._tm_generation += 1
+        try:
+            result = await self._request("POST", "/master-tm/entries", json_body=body)
+        finally:
+            self._tm_generation += 1
+        self.invalidate_cache("/master-tm/")
+        self._tm_misses.clear()
+        # Cached translations may predate this entry and would otherwise
+        # keep ignoring it until they expire.
+        if self._translation_cache is not None:
+            await self._translation_cache.clear(self._cache_namespace)
+        return result
 
     async def get_tm_stats(self) -> dict[str, Any]:
         return await self._request("GET", "/master-tm/stats")
 
     # -- Style Guides -------------------------------------------------------
 
-    async def list_style_guides(self) -> dict[str, Any]:
-        return await self._request("GET", "/style-guide")
+    async def list_style_guides(self, *, max_chars: int | None = None) -> dict[str, Any]:
+        """List style guides; `max_chars` asks the API to trim each guide's content."""
+        params = {"max_chars": max_chars} if max_chars else None
+        return await self._request("GET", "/style-guide", params=params)
 
-    async def get_brand_prompt(self) -> dict[str, Any]:
-        return await self._request("GET", "/style-guide/prompt")
+    async def get_brand_prompt(self, *, max_chars: int | None = None) -> dict[str, Any]:
+        """Fetch the brand voice prompt; `max_chars` asks the API to trim it."""
+        params = {"max_chars": max_chars} if max_chars else None
+        return await self._request("GET", "/style-guide/prompt", params=params)
 
     async def get_combined_prompt(self) -> dict[str, Any]:
         return await self._request("GET", "/style-guide/combined")
@@ -180,8 +787,17 @@ class NativClient:
 # Helpers
 # ---------------------------------------------------------------------------
 
+_client: NativClient | None = None
+
+
 def _get_client() -> NativClient:
-    """Build a NativClient from env vars. Raises on missing key."""
+    """Return the shared NativClient, building it from env vars on first use.
+
+    Raises on missing key.
+    """
+    global _client
+    if _client is not None:
+        return _client
     api_key = os.environ.get("NATIV_API_KEY")
     if not api_key:
         raise RuntimeError(
@@ -189,20 +805,127 @@ def _get_client() -> NativClient:
             "Create one at https://dashboard.usenativ.com → Settings → API Keys"
         )
     base_url = os.environ.get("NATIV_API_URL")
-    return NativClient(api_key, base_url)
+    _client = NativClient(
+        api_key,
+        base_url,
+        cache_ttl=_env_float("NATIV_CACHE_TTL", DEFAULT_CACHE_TTL),
+        translation_cache=_open_translation_cache(),
+        max_retries=_env_int("NATIV_MAX_RETRIES", DEFAULT_MAX_RETRIES, minimum=0),
+        http_backend=os.environ.get("NATIV_HTTP_BACKEND", DEFAULT_HTTP_BACKEND).strip().lower(),
+    )
+    return _client
+
+
+async def reset_client() -> None:
+    """Close the shared NativClient so the next call rebuilds it from env vars."""
+    global _client
+    client, _client = _client, None
+    if client is not None:
+        await client.close()
+
+
+def _open_translation_cache() -> TranslationCache | None:
+    """Open the on-disk translation cache, or return None if disabled/unavailable."""
+    ttl = _env_float("NATIV_TRANSLATION_CACHE_TTL", DEFAULT_TRANSLATION_CACHE_TTL)
+    if ttl <= 0:
+        return None
+    cache_dir = os.environ.get("NATIV_CACHE_DIR") or os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+        "nativ-mcp",
+    )
+    try:
+        return TranslationCache(os.path.join(cache_dir, "translations.sqlite3"), ttl)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Translation cache disabled: %s", e)
+        return None
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a non-negative float from the environment, falling back on bad input."""
+    try:
+        return max(0.0, float(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+def _env_int(name: str, default: int, *, minimum: int) -> int:
+    """Read an int of at least `minimum` from the environment, falling back on bad input."""
+    try:
+        return max(minimum, int(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+def _batch_concurrency() -> int:
+    """Max in-flight translate requests for batch calls (NATIV_BATCH_CONCURRENCY)."""
+    return _env_int("NATIV_BATCH_CONCURRENCY", DEFAULT_BATCH_CONCURRENCY, minimum=1)
+
+
+def _retry_delay(retry_after: str | None, attempt: int) -> float:
+    """Seconds to wait before retry number `attempt + 1`.
+
+    Uses the Retry-After header (seconds or HTTP date) when present, otherwise
+    exponential backoff; both get up to a second of jitter.
+    """
+    delay = float(2 ** attempt)
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                pass
+    return min(max(delay, 0.0), MAX_RETRY_DELAY) + random.random()
 
 
 def _fmt_json(data: Any) -> str:
     """Pretty-print JSON for LLM consumption."""
-    return json.dumps(data, indent=2, ensure_ascii=False, default=str)
+    return orjson.dumps(
+        data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str
+    ).decode()
 
 
 # ---------------------------------------------------------------------------
 # MCP Server
 # ---------------------------------------------------------------------------
 
+
+async def _warmup(client: NativClient) -> None:
+    """Prefetch the settings most sessions read first into the GET cache."""
+    results = await asyncio.gather(
+        client.get_languages(),
+        client.get_brand_prompt(max_chars=BRAND_VOICE_PREVIEW_CHARS + 1),
+        client.list_style_guides(max_chars=STYLE_GUIDE_PREVIEW_CHARS + 1),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.debug("Warm-up request failed: %s", result)
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Warm the cache on startup and close the shared HTTP client on shutdown."""
+    warmup: asyncio.Task | None = None
+    try:
+        client = _get_client()
+    except (RuntimeError, ValueError):
+        client = None  # Misconfigured; tool calls report it.
+    if client is not None and client.cache_enabled:
+        # Runs alongside the MCP handshake, so the first tool calls hit cache.
+        warmup = asyncio.create_task(_warmup(client))
+    try:
+        yield
+    finally:
+        if warmup is not None:
+            warmup.cancel()
+        await reset_client()
+
+
 mcp = FastMCP(
     "nativ",
+    lifespan=_lifespan,
     instructions=(
         "Nativ is an AI-powered localization platform. Use the available tools to "
         "translate text, search translation memory, manage TM entries, and access "
@@ -214,6 +937,25 @@ mcp = FastMCP(
 
 # ===================== TOOLS =====================
 
+# Tool output previews; the matching resources return full content.
+STYLE_GUIDE_PREVIEW_CHARS = 500
+BRAND_VOICE_PREVIEW_CHARS = 2000
+
+# Response fields each tool renders; anything else is not requested.
+_TRANSLATE_FIELDS = frozenset({"translated_text", "tm_match", "rationale"})
+_BATCH_FIELDS = frozenset({"translated_text", "tm_match.score"})
+
+_TRANSLATION_HEADER_TEMPLATE = "**Translation ({language}):** {text}"
+
+_TM_SOURCE_LABELS = {
+    "brand_voice": "Brand Voice",
+    "phrase_tm": "Phrase TM",
+    "phrase_tb": "Phrase Term Base",
+    "user_glossary": "User Glossary",
+    "approved": "Approved Translations",
+    "manual": "Manual Entries",
+}
+
 
 @mcp.tool()
 async def translate(
@@ -257,24 +999,27 @@ async def translate(
         glossary=glossary or None,
         formality=formality or None,
         max_characters=max_characters if max_characters > 0 else None,
-        backtranslate=backtranslate,
+        fields=(_TRANSLATE_FIELDS | {"backtranslation"}) if backtranslate else _TRANSLATE_FIELDS,
     )
 
-    parts = [f"**Translation ({target_language}):** {result.get('translated_text', '')}"]
+    header = _TRANSLATION_HEADER_TEMPLATE.format(
+        language=target_language, text=result.get("translated_text", "")
+    )
+    tm_line = tm_ref_line = backtranslation_line = rationale_line = ""
 
-    tm = result.get("tm_match")
-    if tm and tm.get("score", 0) > 0:
-        parts.append(f"\n**TM Match:** {tm['score']:.0f}% ({tm.get('match_type', 'unknown')}) — source: {tm.get('tm_source', 'N/A')}")
-        if tm.get("source_text"):
-            parts.append(f"  TM reference: \"{tm['source_text']}\" → \"{tm.get('target_text', '')}\"")
+    tm = TMMatch.from_result(result)
+    if tm and tm.score > 0:
+        tm_line = f"\n**TM Match:** {tm.score:.0f}% ({tm.match_type}) — source: {tm.tm_source}"
+        if tm.source_text:
+            tm_ref_line = f"  TM reference: \"{tm.source_text}\" → \"{tm.target_text}\""
 
     if result.get("backtranslation"):
-        parts.append(f"\n**Back-translation:** {result['backtranslation']}")
+        backtranslation_line = f"\n**Back-translation:** {result['backtranslation']}"
 
     if result.get("rationale"):
-        parts.append(f"\n**Rationale:** {result['rationale']}")
+        rationale_line = f"\n**Rationale:** {result['rationale']}"
 
-    return "\n".join(parts)
+    return "\n".join(filter(None, (header, tm_line, tm_ref_line, backtranslation_line, rationale_line)))
 
 
 @mcp.tool()
@@ -290,7 +1035,9 @@ async def translate_batch(
     """Translate multiple texts to a single target language.
 
     Useful for localizing lists of strings, UI labels, or i18n files.
-    Each text is translated individually using the team's TM and style guides.
+    Each text is translated individually using the team's TM and style guides,
+    in a single batch request where the API supports it and otherwise as
+    concurrent requests (see NATIV_BATCH_CONCURRENCY).
 
     Args:
         texts: List of texts to translate.
@@ -302,32 +1049,32 @@ async def translate_batch(
         formality: Tone override for all translations.
     """
     client = _get_client()
-    results = []
-    for i, text in enumerate(texts):
-        try:
-            result = await client.translate(
-                text=text,
-                language=target_language,
-                language_code=target_language_code or None,
-                source_language=source_language,
-                source_language_code=source_language_code,
-                context=context or None,
-                formality=formality or None,
-                include_tm_info=True,
-                backtranslate=False,
-                include_rationale=False,
-            )
-            translated = result.get("translated_text", "")
-            tm = result.get("tm_match")
-            tm_note = ""
-            if tm and tm.get("score", 0) > 0:
-                tm_note = f" (TM {tm['score']:.0f}%)"
-            results.append(f"{i+1}. \"{text}\" → \"{translated}\"{tm_note}")
-        except Exception as e:
-            results.append(f"{i+1}. \"{text}\" → ERROR: {e}")
+    results = await client.translate_many(
+        texts,
+        target_language,
+        concurrency=_batch_concurrency(),
+        language_code=target_language_code or None,
+        source_language=source_language,
+        source_language_code=source_language_code,
+        context=context or None,
+        formality=formality or None,
+        fields=_BATCH_FIELDS,
+    )
+
+    lines = []
+    for i, (text, result) in enumerate(zip(texts, results)):
+        if isinstance(result, Exception):
+            lines.append(f"{i+1}. \"{text}\" → ERROR: {result}")
+            continue
+        translated = result.get("translated_text", "")
+        tm = TMMatch.from_result(result)
+        tm_note = ""
+        if tm and tm.score > 0:
+            tm_note = f" (TM {tm.score:.0f}%)"
+        lines.append(f"{i+1}. \"{text}\" → \"{translated}\"{tm_note}")
 
     header = f"**Batch translation to {target_language}** ({len(texts)} items):\n"
-    return header + "\n".join(results)
+    return header + "\n".join(lines)
 
 
 @mcp.tool()
@@ -337,6 +1084,7 @@ async def search_translation_memory(
     target_language_code: str = "",
     min_score: float = 0.0,
     limit: int = 10,
+    force: bool = False,
 ) -> str:
     """Search the translation memory for existing translations.
 
@@ -349,6 +1097,7 @@ async def search_translation_memory(
         target_language_code: Optional target language code to filter results.
         min_score: Minimum fuzzy match score (0-100). Default 0 returns all.
         limit: Maximum number of results (default 10).
+        force: If true, skip recently cached results and query the TM directly.
     """
     client = _get_client()
     result = await client.search_tm(
@@ -357,20 +1106,22 @@ async def search_translation_memory(
         target_lang=target_language_code or None,
         score_cutoff=min_score,
         limit=limit,
+        force=force,
     )
 
     matches = result.get("matches", [])
     if not matches:
         return f"No translation memory matches found for \"{query}\"."
 
-    lines = [f"**TM Search Results** for \"{query}\" ({len(matches)} matches):\n"]
-    for m in matches:
-        lines.append(
+    return "\n".join([
+        f"**TM Search Results** for \"{query}\" ({len(matches)} matches):\n",
+        *(
             f"- **{m['score']:.0f}%** [{m.get('match_type', '')}] "
             f"\"{m['source_text']}\" → \"{m['target_text']}\" "
             f"(source: {m.get('information_source', 'N/A')})"
-        )
-    return "\n".join(lines)
+            for m in matches
+        ),
+    ])
 
 
 @mcp.tool()
@@ -450,16 +1201,8 @@ async def get_translation_memory_stats() -> str:
     by_source = stats.get("by_source", {})
     if by_source:
         lines.append("\n**By Source:**")
-        source_labels = {
-            "brand_voice": "Brand Voice",
-            "phrase_tm": "Phrase TM",
-            "phrase_tb": "Phrase Term Base",
-            "user_glossary": "User Glossary",
-            "approved": "Approved Translations",
-            "manual": "Manual Entries",
-        }
         for src, counts in by_source.items():
-            label = source_labels.get(src, src)
+            label = _TM_SOURCE_LABELS.get(src, src)
             lines.append(f"- {label}: {counts.get('total', 0)} entries ({counts.get('enabled', 0)} enabled)")
 
     return "\n".join(lines)
@@ -472,7 +1215,9 @@ async def get_style_guides() -> str:
     Returns the titles, content, and enabled status of each style guide.
     """
     client = _get_client()
-    result = await client.list_style_guides()
+    # One extra character lets us tell a trimmed guide from one of exactly
+    # STYLE_GUIDE_PREVIEW_CHARS without downloading the rest of it.
+    result = await client.list_style_guides(max_chars=STYLE_GUIDE_PREVIEW_CHARS + 1)
     guides = result.get("guides", [])
 
     if not guides:
@@ -483,8 +1228,8 @@ async def get_style_guides() -> str:
         status = "enabled" if g.get("is_enabled") else "disabled"
         lines.append(f"### {g.get('title', 'Untitled')} ({status})")
         content = g.get("content", "")
-        if len(content) > 500:
-            content = content[:500] + "..."
+        if len(content) > STYLE_GUIDE_PREVIEW_CHARS:
+            content = content[:STYLE_GUIDE_PREVIEW_CHARS] + "..."
         lines.append(content)
         lines.append("")
     return "\n".join(lines)
@@ -498,14 +1243,17 @@ async def get_brand_voice() -> str:
     the brand's tone, personality, terminology, and localization guidelines.
     """
     client = _get_client()
-    result = await client.get_brand_prompt()
+    result = await client.get_brand_prompt(max_chars=BRAND_VOICE_PREVIEW_CHARS + 1)
 
     if not result.get("exists"):
         return "No brand voice prompt configured. Set one up at https://dashboard.usenativ.com → Settings → Style Guides"
 
     prompt = result.get("prompt", "")
-    if len(prompt) > 2000:
-        return f"**Brand Voice Prompt:**\n\n{prompt[:2000]}...\n\n(Truncated — full prompt has {len(prompt)} characters)"
+    if len(prompt) > BRAND_VOICE_PREVIEW_CHARS:
+        return (
+            f"**Brand Voice Prompt:**\n\n{prompt[:BRAND_VOICE_PREVIEW_CHARS]}...\n\n"
+            "(Truncated — read the nativ://brand-prompt resource for the full prompt)"
+        )
     return f"**Brand Voice Prompt:**\n\n{prompt}"
 
 
@@ -547,6 +1295,22 @@ async def resource_tm_stats() -> str:
 # ===================== PROMPTS =====================
 
 
+_LOCALIZE_CONTENT_TEMPLATE = """\
+You are helping localize content using Nativ's AI localization platform.
+
+## Instructions
+
+1. First, call `get_languages` to see which languages are configured and their formality/style settings.
+2. Call `get_brand_voice` to understand the brand's localization personality.
+3. Translate the content below {languages_line}
+4. For each language, use the `translate` tool with the appropriate formality and context.
+5. Present results in a clear table: Source | Language | Translation | TM Match %
+
+## Content to Localize
+
+{content}{context_section}"""
+
+
 @mcp.prompt()
 def localize_content(
     content: str,
@@ -560,30 +1324,36 @@ def localize_content(
         target_languages: Comma-separated list of target languages (e.g. "French, German, Japanese"). Leave empty to use all configured languages.
         context: Optional context about the content (e.g. "marketing email subject line").
     """
-    parts = [
-        "You are helping localize content using Nativ's AI localization platform.\n",
-        "## Instructions\n",
-        "1. First, call `get_languages` to see which languages are configured and their formality/style settings.",
-        "2. Call `get_brand_voice` to understand the brand's localization personality.",
-    ]
+    return _LOCALIZE_CONTENT_TEMPLATE.format(
+        languages_line=(
+            f"into: **{target_languages}**" if target_languages else "into **all configured languages**."
+        ),
+        content=content,
+        context_section=f"\n\n## Context\n\n{context}" if context else "",
+    )
 
-    if target_languages:
-        parts.append(f"3. Translate the content below into: **{target_languages}**")
-    else:
-        parts.append("3. Translate the content below into **all configured languages**.")
-
-    parts.extend([
-        "4. For each language, use the `translate` tool with the appropriate formality and context.",
-        "5. Present results in a clear table: Source | Language | Translation | TM Match %",
-        "",
-        "## Content to Localize\n",
-        content,
-    ])
 
-    if context:
-        parts.extend(["", f"## Context\n", context])
+_REVIEW_TRANSLATION_TEMPLATE = """\
+You are reviewing a translation for quality using Nativ.
+
+## Instructions
+
+1. Call `get_brand_voice` to understand the brand's localization guidelines.
+2. Call `get_style_guides` to check for any relevant style rules.
+3. Call `search_translation_memory` with the source text to find existing TM matches for {target_language}.
+4. Compare the translation against TM matches and style guides.
+5. Provide feedback on:
+   - Accuracy: Does it preserve the original meaning?
+   - Consistency: Does it match existing TM entries?
+   - Brand voice: Does it follow style guide rules?
+   - Tone: Is the formality level appropriate?
+6. If the translation is good, suggest adding it to TM with `add_translation_memory_entry`.
+
+## Source Text
+{source_text}
 
-    return "\n".join(parts)
+## Translation ({target_language})
+{translated_text}"""
 
 
 @mcp.prompt()
@@ -599,24 +1369,31 @@ def review_translation(
         translated_text: The translation to review.
         target_language: The target language name.
     """
-    return "\n".join([
-        "You are reviewing a translation for quality using Nativ.\n",
-        "## Instructions\n",
-        "1. Call `get_brand_voice` to understand the brand's localization guidelines.",
-        "2. Call `get_style_guides` to check for any relevant style rules.",
-        f"3. Call `search_translation_memory` with the source text to find existing TM matches for {target_language}.",
-        "4. Compare the translation against TM matches and style guides.",
-        "5. Provide feedback on:",
-        "   - Accuracy: Does it preserve the original meaning?",
-        "   - Consistency: Does it match existing TM entries?",
-        "   - Brand voice: Does it follow style guide rules?",
-        "   - Tone: Is the formality level appropriate?",
-        "6. If the translation is good, suggest adding it to TM with `add_translation_memory_entry`.",
-        "",
-        f"## Source Text\n{source_text}",
-        "",
-        f"## Translation ({target_language})\n{translated_text}",
-    ])
+    return _REVIEW_TRANSLATION_TEMPLATE.format(
+        source_text=source_text,
+        translated_text=translated_text,
+        target_language=target_language,
+    )
+
+
+_BATCH_LOCALIZE_STRINGS_TEMPLATE = """\
+You are batch-localizing i18n strings using Nativ.
+
+## Instructions
+
+1. Call `get_languages` to see configured languages.
+2. Parse the strings below (format hint: {format_hint}).
+3. Use `translate_batch` for each target language to translate all strings at once.
+4. Output results in **{format_hint}** format, preserving the original keys/structure.
+5. If any TM matches are >= 90%, note them — these are well-established translations.
+
+## Target Languages
+{target_languages}
+
+## Strings
+```
+{strings}
+```"""
 
 
 @mcp.prompt()
@@ -632,19 +1409,11 @@ def batch_localize_strings(
         target_languages: Comma-separated target languages. Leave empty for all configured.
         format_hint: Expected output format: "json", "csv", or "plain".
     """
-    return "\n".join([
-        "You are batch-localizing i18n strings using Nativ.\n",
-        "## Instructions\n",
-        "1. Call `get_languages` to see configured languages.",
-        f"2. Parse the strings below (format hint: {format_hint}).",
-        "3. Use `translate_batch` for each target language to translate all strings at once.",
-        f"4. Output results in **{format_hint}** format, preserving the original keys/structure.",
-        "5. If any TM matches are >= 90%, note them — these are well-established translations.",
-        "",
-        f"## Target Languages\n{target_languages if target_languages else '(all configured languages)'}",
-        "",
-        f"## Strings\n```\n{strings}\n```",
-    ])
+    return _BATCH_LOCALIZE_STRINGS_TEMPLATE.format(
+        strings=strings,
+        target_languages=target_languages or "(all configured languages)",
+        format_hint=format_hint,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -653,7 +1422,16 @@ def batch_localize_strings(
 
 
 def main():
-    mcp.run(transport="stdio")
+    # Optional faster event loop, installed via the `fast` extra.
+    try:
+        if sys.platform == "win32":
+            import winloop as fast_loop
+        else:
+            import uvloop as fast_loop
+    except ImportError:
+        mcp.run(transport="stdio")
+    else:
+        fast_loop.run(mcp.run_stdio_async())
 
 
 if __name__ == "__main__":